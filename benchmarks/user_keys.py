@@ -0,0 +1,85 @@
+'''
+insert throughput and database file size for the User.id key formats,
+usage:
+
+    python -m benchmarks.user_keys [rows]
+
+runs against plain sqlite3 files in a temp directory with the same
+PRAGMAs as _DBInterface, so only the key layout differs between runs
+'''
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, List, Tuple
+from src.utils.ids import uuid7
+
+BATCH_SIZE = 1_000
+
+_COLUMNS = '''
+    username VARCHAR(50) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE,
+    permission VARCHAR(10) NOT NULL
+'''
+
+SCHEMAS: Dict[str, Tuple[str, Callable[[], object]]] = {
+    # the original layout: pk + unique + index on a 36 character string
+    "uuid4 text (pk+unique+index)": (
+        f'''
+        CREATE TABLE users (id VARCHAR(36) NOT NULL PRIMARY KEY UNIQUE, {_COLUMNS});
+        CREATE INDEX ix_users_id ON users (id);
+        ''',
+        lambda: str(uuid.uuid4())
+    ),
+    "uuid4 text (pk only)": (
+        f"CREATE TABLE users (id VARCHAR(36) NOT NULL PRIMARY KEY, {_COLUMNS});",
+        lambda: str(uuid.uuid4())
+    ),
+    "uuid7 blob (without rowid)": (
+        f"CREATE TABLE users (id BLOB NOT NULL PRIMARY KEY, {_COLUMNS}) WITHOUT ROWID;",
+        lambda: uuid7().bytes
+    ),
+}
+
+
+def run(name: str, ddl: str, make_id: Callable[[], object], rows: int, workdir: str) -> None:
+    path = os.path.join(workdir, f"{abs(hash(name))}.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.executescript(ddl)
+
+    elapsed = 0.0
+    for start in range(0, rows, BATCH_SIZE):
+        batch: List[tuple] = [
+            (make_id(), f"user{i}", "x" * 60, f"user{i}@example.com", "user")
+            for i in range(start, min(start + BATCH_SIZE, rows))
+        ]
+        began = time.perf_counter()
+        with conn:
+            conn.executemany(
+                "INSERT INTO users (id, username, password, email, permission) "
+                "VALUES (?, ?, ?, ?, ?)",
+                batch
+            )
+        elapsed += time.perf_counter() - began
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"{name:<32} {rows / elapsed:>12,.0f} rows/s {size_mb:>10.2f} MiB")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'key format':<32} {'inserts':>19} {'file size':>14}  ({rows:,} rows)")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (ddl, make_id) in SCHEMAS.items():
+            run(name, ddl, make_id, rows, workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+'''
+throughput of CreateUser validation, usage:
+
+    python -m benchmarks.user_validation [records]
+
+compares the old five-scan password check with ValidateUser.pwd_errors,
+and CreateUser validation when every email has its own domain (every
+domain cache lookup misses) against a batch sharing a few domains.
+the TypeAdapter batch API runs at the same rate as per-row model_validate,
+it is measured for completeness, not as a speedup
+'''
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from src.user.schemas.user import (
+    CreateUser,
+    ValidateUser,
+    validate_create_users
+)
+
+
+def _legacy_check_pwd(password: str) -> None:
+    '''the assert-based check ValidateUser.pwd_errors replaced'''
+    assert not ' ' in password
+    assert any(char.isdigit() for char in password)
+    assert any(char.isalpha() for char in password)
+    assert any(char.islower() for char in password)
+    assert any(char.isupper() for char in password)
+
+
+SHARED_DOMAINS = ["example.com", "example.org", "mail.example.net", "school.edu", "corp.example.io"]
+
+
+def make_payloads(records: int, domains: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    '''one domain per record unless a list of domains to cycle through is given'''
+    return [
+        {
+            "username": f"user{i}",
+            "password": f"longer-password-{i}-Secret",
+            "email": f"user{i}@" + (
+                domains[i % len(domains)] if domains else f"host{i}.example.com"
+            ),
+        }
+        for i in range(records)
+    ]
+
+
+def timed(name: str, records: int, func: Callable[[], Any]) -> None:
+    began = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - began
+    print(f"{name:<40} {records / elapsed:>12,.0f} records/s {elapsed:>8.2f} s")
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    unique = make_payloads(records)
+    shared = make_payloads(records, SHARED_DOMAINS)
+    passwords = [payload["password"] for payload in shared]
+    print(f"{records:,} records")
+
+    timed("password: legacy five scans", records,
+          lambda: [_legacy_check_pwd(pwd) for pwd in passwords])
+    timed("password: single pass", records,
+          lambda: [ValidateUser.pwd_errors(pwd) for pwd in passwords])
+    timed("model_validate, unique domains", records,
+          lambda: [CreateUser.model_validate(payload) for payload in unique])
+    timed("model_validate, shared domains", records,
+          lambda: [CreateUser.model_validate(payload) for payload in shared])
+    timed("validate_create_users, shared domains", records,
+          lambda: validate_create_users(shared))
+
+
+if __name__ == '__main__':
+    main()
@@ -15,5 +15,6 @@ app = FastAPI(
     debug=settings.DEBUG,
     lifespan=build_tools.life_span
 )
+build_tools.register_middleware(app)
 build_tools.register_routes(app)
 
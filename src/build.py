@@ -1,15 +1,28 @@
 from src.db import init_db
+from src.config.app_config import settings
+from src.config.log_config import LogConfig, RequestIdMiddleware
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 from fastapi import FastAPI
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def life_span(app: FastAPI) -> AsyncGenerator:
-    print("Starting Application...")
-    await init_db()
-    yield
-    print("Shutting Down Application...")
+    LogConfig.start(settings)
+    try:
+        logger.info("Starting Application...")
+        await init_db()
+        yield
+        logger.info("Shutting Down Application...")
+    finally:
+        LogConfig.stop()
+
+
+def register_middleware(app: FastAPI) -> None:
+    app.add_middleware(RequestIdMiddleware)
 
 
 def register_routes(app: FastAPI) -> None:
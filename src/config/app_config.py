@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict 
     
 class Settings(BaseSettings):
@@ -8,11 +9,22 @@ class Settings(BaseSettings):
     
     LOG_TO_CONSOLE: bool = True
     LOG_TO_FILE: bool = True
+    LOG_LEVEL: str = 'INFO'
+    LOG_JSON: bool = False
+    LOG_DIR: str = 'logs'
+    LOG_FILE_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_FILE_BACKUPS: int = 5
     
     SECRET_KEY: str 
     DATABASE_URL: str
     DEBUG: bool = True 
     DB_ECHO: bool = True 
+    # fraction of the SQL statements logged when DB_ECHO is on
+    DB_ECHO_SAMPLE_RATE: float = Field(1.0, ge=0, le=1)
+    # store User.id as a time-ordered UUIDv7 in a 16-byte BLOB instead of
+    # a 36 character UUID4 string, existing databases need
+    # `python -m src.db.migrate_user_ids` after switching this on
+    BINARY_USER_IDS: bool = False
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,214 @@
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .app_config import Settings
+
+REQUEST_ID_HEADER = "X-Request-ID"
+request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
+# the keep / drop decision of the last sampled SQL statement
+_sql_echo_kept: ContextVar[bool] = ContextVar("sql_echo_kept", default=True)
+
+_EXC_FORMATTER = logging.Formatter()
+_TEXT_FORMAT = "%(asctime)s %(levelname)-8s [%(request_id)s] %(name)s: %(message)s"
+
+
+class RequestIdFilter(logging.Filter):
+    '''stamps each record with the correlation id of the current request'''
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_ctx.get()
+        return True
+
+
+class SqlEchoSampler(logging.Filter):
+    '''
+       keeps only a fraction of the sqlalchemy.engine statement logs, the
+       "[generated in ...] (params)" record SQLAlchemy logs after a statement
+       follows the decision made for that statement
+    '''
+
+    def __init__(self, sample_rate: float) -> None:
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.name.startswith("sqlalchemy.engine"):
+            return True
+        # only the statement echo is sampled, warnings & errors always pass
+        if record.levelno > logging.INFO:
+            return True
+        if self.sample_rate >= 1.0:
+            return True
+        if isinstance(record.msg, str) and record.msg.startswith("["):
+            return _sql_echo_kept.get()
+        keep = random.random() < self.sample_rate
+        _sql_echo_kept.set(keep)
+        return keep
+
+
+class JsonFormatter(logging.Formatter):
+    '''formats records as one JSON object per line'''
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class _TracebackQueueHandler(QueueHandler):
+    '''
+       QueueHandler.prepare folds the traceback into msg, this keeps it in
+       exc_text instead so formatters on the listener can place it themselves
+    '''
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class LogConfig:
+    '''
+       configures the root logger from Settings, records are put on a queue
+       by a QueueHandler and written to the console / rotating files by a
+       QueueListener thread, so logging never blocks the event loop
+    '''
+    _listener: Optional[QueueListener] = None
+    _queue_handler: Optional[QueueHandler] = None
+    _uvicorn_state: List[Tuple[logging.Logger, List[logging.Handler], bool]] = []
+
+    @classmethod
+    def _output_handlers(cls, settings: Settings) -> List[logging.Handler]:
+        formatter: logging.Formatter = (
+            JsonFormatter() if settings.LOG_JSON else logging.Formatter(_TEXT_FORMAT)
+        )
+        handlers: List[logging.Handler] = []
+        if settings.LOG_TO_CONSOLE:
+            handlers.append(logging.StreamHandler())
+        if settings.LOG_TO_FILE:
+            os.makedirs(settings.LOG_DIR, exist_ok=True)
+            handlers.append(RotatingFileHandler(
+                os.path.join(settings.LOG_DIR, "helios.log"),
+                maxBytes=settings.LOG_FILE_MAX_BYTES,
+                backupCount=settings.LOG_FILE_BACKUPS,
+                encoding="utf-8"
+            ))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        return handlers
+
+    @classmethod
+    def start(cls, settings: Settings) -> None:
+        if cls._listener is not None:
+            return
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _TracebackQueueHandler(log_queue)
+        # filters run on the calling thread, where the request context lives
+        queue_handler.addFilter(RequestIdFilter())
+        queue_handler.addFilter(SqlEchoSampler(settings.DB_ECHO_SAMPLE_RATE))
+
+        root = logging.getLogger()
+        root.setLevel(settings.LOG_LEVEL.upper())
+        root.addHandler(queue_handler)
+
+        # uvicorn installs its own stream handlers and stops propagation,
+        # send its error / access lines through the queue as well, the
+        # originals are restored by stop() for uvicorn's shutdown messages
+        for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+            uvicorn_logger = logging.getLogger(name)
+            cls._uvicorn_state.append(
+                (uvicorn_logger, list(uvicorn_logger.handlers), uvicorn_logger.propagate)
+            )
+            uvicorn_logger.handlers.clear()
+            uvicorn_logger.propagate = True
+
+        # routed through the queue instead of create_async_engine(echo=...),
+        # which attaches its own blocking StreamHandler
+        logging.getLogger("sqlalchemy.engine").setLevel(
+            logging.INFO if settings.DB_ECHO else logging.WARNING
+        )
+
+        cls._queue_handler = queue_handler
+        cls._listener = QueueListener(
+            log_queue,
+            *cls._output_handlers(settings),
+            respect_handler_level=True
+        )
+        cls._listener.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        '''
+           flushes the queue, closes the output handlers and gives uvicorn
+           its own handlers back
+        '''
+        if cls._listener is None:
+            return
+        for uvicorn_logger, handlers, propagate in cls._uvicorn_state:
+            uvicorn_logger.handlers[:] = handlers
+            uvicorn_logger.propagate = propagate
+        cls._uvicorn_state = []
+        logging.getLogger().removeHandler(cls._queue_handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._listener = None
+        cls._queue_handler = None
+
+
+class RequestIdMiddleware:
+    '''
+       sets the correlation id for each request from the X-Request-ID header
+       (or a new one) and echoes it back on the response
+    '''
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = REQUEST_ID_HEADER.lower().encode()
+        request_id = next(
+            (v.decode("latin-1") for k, v in scope["headers"] if k == header),
+            uuid.uuid4().hex
+        )[:64]
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (header, request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        token = request_id_ctx.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_ctx.reset(token)
@@ -4,6 +4,7 @@ from ..config.app_config import settings
 import os
 from ._db_internals import _DBInterface
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Connection
 from .crud import CRUDService
 
 __all__ = ["Base", "init_db", "get_session", "CRUDService"]
@@ -22,9 +23,26 @@ async def init_db() -> None:
     async with engine.begin() as connection:
         from src.models import User
         await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(_check_user_id_format)
     if not tables_exist:
         await _init_db_defaults()
 
+def _check_user_id_format(connection: Connection) -> None:
+    '''
+    create_all never alters an existing table, so make sure the stored
+    users.id column matches settings.BINARY_USER_IDS before serving requests
+    '''
+    columns = connection.exec_driver_sql("PRAGMA table_info(users)").fetchall()
+    id_type = next((col[2] for col in columns if col[1] == "id"), None)
+    if id_type is None:
+        return
+    if (id_type.upper() == "BLOB") != settings.BINARY_USER_IDS:
+        raise RuntimeError(
+            f"users.id is stored as {id_type} but BINARY_USER_IDS is "
+            f"{settings.BINARY_USER_IDS}, run `python -m src.db.migrate_user_ids` "
+            "to rebuild the users table."
+        )
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     '''gets a async_sessionmaker from _DBInterface'''
     async_sess = _DBInterface.get_session_factory()
@@ -32,7 +32,7 @@ class _DBInterface:
         if cls._engine is None:
             cls._engine = create_async_engine(
                 settings.DATABASE_URL,
-                echo=settings.DB_ECHO,
+                # DB_ECHO is handled by LogConfig through the logging queue
                 connect_args=cls._CONNECT_ARGS
             )
         return cls._engine
@@ -0,0 +1,92 @@
+'''
+rebuilds the users table of an existing database so it matches the
+current User model, usage:
+
+    python -m src.db.migrate_user_ids
+
+- with BINARY_USER_IDS=True the 36 character ids are rewritten as
+  16-byte BLOBs (existing ids keep their value, new users get UUIDv7s)
+  and the table is recreated WITHOUT ROWID
+- with BINARY_USER_IDS=False the ids are kept as strings, this still
+  drops the redundant unique/index on the primary key of older databases
+'''
+import asyncio
+import uuid
+from typing import Any
+from sqlalchemy import inspect, insert, text
+from sqlalchemy.engine import Connection
+from ._db_internals import _DBInterface
+from ..config.app_config import settings
+
+_OLD_TABLE = "users_old"
+
+
+def _normalize_id(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return str(uuid.UUID(bytes=bytes(value)))
+    return str(uuid.UUID(str(value)))
+
+
+def _rebuild_users(connection: Connection) -> int:
+    from src.models import User
+    table = User.__table__
+    inspector = inspect(connection)
+    if not inspector.has_table(table.name):
+        return 0
+    if inspector.has_table(_OLD_TABLE):
+        raise RuntimeError(
+            f"Table '{_OLD_TABLE}' already exists, remove it before migrating."
+        )
+
+    # read and normalize every row before touching the schema
+    columns = {column.name for column in table.columns}
+    rows = []
+    for row in connection.execute(text(f"SELECT * FROM {table.name}")):
+        values = {k: v for k, v in row._mapping.items() if k in columns}
+        values["id"] = _normalize_id(values["id"])
+        rows.append(values)
+
+    connection.exec_driver_sql(
+        f"ALTER TABLE {table.name} RENAME TO {_OLD_TABLE}"
+    )
+    table.create(connection)
+    if rows:
+        connection.execute(insert(table), rows)
+    connection.exec_driver_sql(f"DROP TABLE {_OLD_TABLE}")
+    return len(rows)
+
+
+async def migrate_user_ids() -> int:
+    '''rebuilds the users table in one transaction, returns rows copied'''
+    engine = _DBInterface.get_engine()
+    async with engine.connect() as connection:
+        # the sqlite drivers only open a transaction implicitly before DML,
+        # so with driver autocommit BEGIN is emitted by hand to make the
+        # ALTER / CREATE roll back together with the copy on failure
+        connection = await connection.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        await connection.exec_driver_sql("BEGIN")
+        try:
+            copied = await connection.run_sync(_rebuild_users)
+        except BaseException:
+            await connection.exec_driver_sql("ROLLBACK")
+            raise
+        await connection.exec_driver_sql("COMMIT")
+
+        # reclaim the pages freed by the old table
+        await connection.exec_driver_sql("VACUUM")
+    await engine.dispose()
+    return copied
+
+
+def main() -> None:
+    copied = asyncio.run(migrate_user_ids())
+    if settings.BINARY_USER_IDS:
+        print(f"Re-encoded {copied} user ids as 16-byte BLOBs.")
+    else:
+        print(f"Rebuilt the users table, kept {copied} user ids as strings.")
+
+
+if __name__ == '__main__':
+    main()
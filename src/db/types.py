@@ -0,0 +1,31 @@
+import uuid
+from typing import Any, Optional
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator):
+    '''
+       stores a UUID as a 16-byte BLOB while the ORM and the API keep
+       working with canonical 36 character strings.
+       accepts str, uuid.UUID or raw bytes as bind parameters
+    '''
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        if isinstance(value, (bytes, bytearray)):
+            if len(value) != 16:
+                raise ValueError("Binary UUID must be exactly 16 bytes.")
+            return bytes(value)
+        return uuid.UUID(str(value)).bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
@@ -1,8 +1,10 @@
 from sqlalchemy import String, ForeignKey, Integer, Column, Enum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-import uuid
 from typing import Optional
 from src.db import Base
+from src.db.types import BinaryUUID
+from src.config.app_config import settings
+from src.utils.ids import new_user_id
 import enum
 
 
@@ -17,7 +19,8 @@ class User(Base):
     models the user info, one-to-one -> user_data
 
     Attributes:
-        id (str): UUID primary key for the User.
+        id (str): UUID primary key for the User, a UUID4 string or a
+            UUIDv7 stored as a 16-byte BLOB when settings.BINARY_USER_IDS.
         username (str): Unique username.
         password (str): Hashed user password.
         email (str): Unique user email.
@@ -25,13 +28,16 @@ class User(Base):
         user_data (UserData): One-to-one relationship with UserData.
     """
     __tablename__ = "users"
+    # binary keys are time-ordered, so cluster rows on them directly
+    # instead of keeping a rowid table plus a separate primary key index
+    __table_args__ = (
+        {"sqlite_with_rowid": False} if settings.BINARY_USER_IDS else {}
+    )
 
     id = Column(
-        String(36),
+        BinaryUUID() if settings.BINARY_USER_IDS else String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
-        unique=True,
-        index=True
+        default=new_user_id
     )
     username = Column(
         String(50),
@@ -7,7 +7,6 @@ from src.user.schemas.user import (
     UserRead,
     UserUpdate
 )
-from src.models import User
 from typing import List
 
 user_router = APIRouter(prefix="/user", tags=["user"])
@@ -48,7 +47,7 @@ async def get_all_users(db: AsyncSession = Depends(get_session)) -> List[UserRea
 
 @user_router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: str, db: AsyncSession = Depends(get_session)) -> None:
-    deleted_user = await user_service.get_by(User.id == user_id, db)
+    deleted_user = await user_service.get_by_id(db, user_id)
     if not deleted_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,7 +59,7 @@ async def delete_user(user_id: str, db: AsyncSession = Depends(get_session)) ->
 @user_router.get("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
 async def get_user(user_id: str, db: AsyncSession = Depends(get_session)) -> UserRead:
     '''gets a user given an ID; 404 if not found'''
-    user = await user_service.get_by(User.id == user_id, db)
+    user = await user_service.get_by_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +75,7 @@ async def update_user(
     db: AsyncSession = Depends(get_session)
 ) -> dict:
 
-    user = await user_service.get_by(User.id == user_id, db)
+    user = await user_service.get_by_id(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -1 +1,8 @@
-from .user import BaseUser, CreateUser, UserUpdate, UserRead
\ No newline at end of file
+from .user import (
+    BaseUser,
+    CreateUser,
+    UserUpdate,
+    UserRead,
+    validate_create_users,
+    validate_create_users_json
+)
\ No newline at end of file
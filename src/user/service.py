@@ -1,3 +1,4 @@
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db import CRUDService
 from ..models.user import User
@@ -8,12 +9,20 @@ from .schemas import (
 )
 from fastapi import HTTPException, status
 from src.utils.security import PasswordUtils
+from src.utils.ids import normalize_user_id
 
 
 class UserService(CRUDService[User]):
     def __init__(self) -> None:
         super().__init__(User)
 
+    async def get_by_id(self, db: AsyncSession, user_id: str) -> Optional[User]:
+        '''gets a user by ID, None for IDs that are not a valid UUID'''
+        canonical_id = normalize_user_id(user_id)
+        if canonical_id is None:
+            return None
+        return await self.get_by(User.id == canonical_id, db)
+
     async def username_exists(self, db: AsyncSession, user_schema_obj: BaseUser) -> bool:
         existing_username = await self.get_by(
             User.username == user_schema_obj.username,
@@ -56,7 +65,7 @@ class UserService(CRUDService[User]):
         await self.update(db, user, user_data)
 
     async def delete_user(self, db: AsyncSession, user_id: str,) -> None:
-        user = await self.get_by(User.id == user_id, db)
+        user = await self.get_by_id(db, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,32 @@
+import importlib
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict
+
+_DOMAIN_CACHE_SIZE = 4096
+
+
+def cache_email_domains() -> None:
+    '''
+        email_validator checks (and IDNA encodes) the domain of every
+        address it validates, which is most of the cost of EmailStr.
+        bulk batches share a handful of domains, so memoize that step;
+        local parts are still fully checked on every call and invalid
+        domains, which raise, are never cached
+    '''
+    try:
+        module = importlib.import_module("email_validator.validate_email")
+    except ImportError:
+        return
+    validate_domain: Callable[..., Dict[str, Any]] = module.validate_email_domain_name
+    if hasattr(validate_domain, "cache_info"):
+        return
+
+    cached = lru_cache(maxsize=_DOMAIN_CACHE_SIZE)(validate_domain)
+
+    @wraps(validate_domain)
+    def validate_email_domain_name(domain: str, **kwargs: Any) -> Dict[str, Any]:
+        # copy so a caller can't change the cached result
+        return dict(cached(domain, **kwargs))
+
+    validate_email_domain_name.cache_info = cached.cache_info  # type: ignore
+    module.validate_email_domain_name = validate_email_domain_name
@@ -0,0 +1,51 @@
+import os
+import threading
+import time
+import uuid
+from typing import Optional
+from src.config.app_config import settings
+
+_uuid7_lock = threading.Lock()
+_last_uuid7 = 0
+
+
+def uuid7() -> uuid.UUID:
+    '''
+        generates a time-ordered UUIDv7 (RFC 9562): a 48-bit unix
+        millisecond timestamp followed by 74 random bits, so keys
+        generated later sort (and insert) after earlier ones, keys made
+        within the same millisecond are kept monotonic by incrementing
+        the previous one
+    '''
+    global _last_uuid7
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                           # version
+    value |= (rand >> 62 & 0xFFF) << 64          # rand_a
+    value |= 0b10 << 62                          # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF        # rand_b
+    with _uuid7_lock:
+        if value <= _last_uuid7:
+            value = _last_uuid7 + 1
+        _last_uuid7 = value
+    return uuid.UUID(int=value)
+
+
+def new_user_id() -> str:
+    '''the default for User.id, format depends on settings.BINARY_USER_IDS'''
+    if settings.BINARY_USER_IDS:
+        return str(uuid7())
+    return str(uuid.uuid4())
+
+
+def normalize_user_id(user_id: str) -> Optional[str]:
+    '''
+        returns the canonical lowercase, hyphenated form of user_id so it
+        matches the same way for string and binary keys, None if it isn't
+        a UUID
+    '''
+    try:
+        return str(uuid.UUID(user_id))
+    except (ValueError, AttributeError, TypeError):
+        return None